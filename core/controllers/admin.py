@@ -270,7 +270,8 @@ class AdminHandler(base.BaseHandler):
                 }
             elif action == 'update_feature_flag_rules':
                 feature_name = self.normalized_payload.get('feature_name')
-                new_rule_dicts = self.normalized_payload.get('new_rules')
+                new_rules = self.normalized_payload.get('new_rules')
+                new_rule_dicts = [rule.to_dict() for rule in new_rules]
                 commit_message = self.normalized_payload.get('commit_message')
 
                 try:
@@ -57,6 +57,16 @@ AUTH_HANDLER_PATHS = (
     '/session_end',
 )
 
+# A shared encoder instance for JSON responses. JSONEncoder objects are
+# stateless and thread-safe, so one instance can serve every request
+# instead of json.dumps() constructing a new encoder per call.
+JSON_ENCODER_FOR_HTML = utils.JSONEncoderForHTML()
+
+# The body of a JSON response with no values, encoded once at import time.
+# Many handlers (event handlers in particular) respond with an empty dict,
+# so render_json() reuses this instead of serializing {} on each request.
+EMPTY_JSON_RESPONSE_BODY = b'%s{}' % feconf.XSSI_PREFIX
+
 
 @functools.lru_cache(maxsize=128)
 def load_template(filename):
@@ -519,7 +529,14 @@ class BaseHandler(webapp2.RequestHandler):
         self.response.headers['X-Content-Type-Options'] = 'nosniff'
         self.response.headers['X-Xss-Protection'] = '1; mode=block'
 
-        json_output = json.dumps(values, cls=utils.JSONEncoderForHTML)
+        # Empty responses are common enough (most event handlers return them)
+        # that the pre-encoded body below is shared instead of re-encoding an
+        # empty dict on every such request.
+        if values == {}:
+            self.response.write(EMPTY_JSON_RESPONSE_BODY)
+            return
+
+        json_output = JSON_ENCODER_FOR_HTML.encode(values)
         # Write expects bytes, thus we need to encode the JSON output.
         self.response.write(
             b'%s%s' % (feconf.XSSI_PREFIX, json_output.encode('utf-8')))
@@ -30,6 +30,23 @@ from core.domain import state_domain
 
 from typing import Dict, Optional, Union
 
+# Properties that every aggregated stats dict must contain. These are
+# constructed once at import time since validate_aggregated_stats() runs on
+# every stats event batch.
+EXPLORATION_STATS_PROPERTIES = (
+    'num_starts',
+    'num_actual_starts',
+    'num_completions'
+)
+STATE_STATS_PROPERTIES = (
+    'total_answers_count',
+    'useful_feedback_count',
+    'total_hit_count',
+    'first_hit_count',
+    'num_times_solution_viewed',
+    'num_completions'
+)
+
 
 def validate_exploration_change(obj):
     """Validates exploration change.
@@ -154,27 +171,14 @@ def validate_aggregated_stats(aggregated_stats):
     Raises:
         InvalidInputException. Property not in aggregated stats dict.
     """
-    exploration_stats_properties = [
-        'num_starts',
-        'num_actual_starts',
-        'num_completions'
-    ]
-    state_stats_properties = [
-        'total_answers_count',
-        'useful_feedback_count',
-        'total_hit_count',
-        'first_hit_count',
-        'num_times_solution_viewed',
-        'num_completions'
-    ]
-    for exp_stats_property in exploration_stats_properties:
+    for exp_stats_property in EXPLORATION_STATS_PROPERTIES:
         if exp_stats_property not in aggregated_stats:
             raise base.BaseHandler.InvalidInputException(
                 '%s not in aggregated stats dict.' % (exp_stats_property))
     state_stats_mapping = aggregated_stats['state_stats_mapping']
-    for state_name in state_stats_mapping:
-        for state_stats_property in state_stats_properties:
-            if state_stats_property not in state_stats_mapping[state_name]:
+    for state_name, state_stats in state_stats_mapping.items():
+        for state_stats_property in STATE_STATS_PROPERTIES:
+            if state_stats_property not in state_stats:
                 raise base.BaseHandler.InvalidInputException(
                     '%s not in state stats mapping of %s in aggregated '
                     'stats dict.' % (state_stats_property, state_name))
@@ -897,7 +897,7 @@ class ResolveIssueHandler(EditorHandler):
     @acl_decorators.can_edit_exploration
     def post(self, exp_id):
         """Handles POST requests."""
-        exp_issue_dict = self.normalized_payload.get('exp_issue_dict')
+        exp_issue = self.normalized_payload.get('exp_issue_dict')
         exp_version = self.normalized_payload.get('exp_version')
 
         exp_issues = stats_services.get_exp_issues(exp_id, exp_version)
@@ -908,10 +908,12 @@ class ResolveIssueHandler(EditorHandler):
         # Check that the passed in issue actually exists in the exploration
         # issues instance.
         issue_to_remove = None
-        for issue in exp_issues.unresolved_issues:
-            if issue.to_dict() == exp_issue_dict:
-                issue_to_remove = issue
-                break
+        if exp_issue is not None:
+            exp_issue_dict = exp_issue.to_dict()
+            for issue in exp_issues.unresolved_issues:
+                if issue.to_dict() == exp_issue_dict:
+                    issue_to_remove = issue
+                    break
 
         if not issue_to_remove:
             raise self.PageNotFoundException(
@@ -128,7 +128,6 @@ HANDLER_CLASS_NAMES_WHICH_STILL_NEED_SCHEMAS = [
     'EditableStoryDataHandler',
     'EditableSubtopicPageDataHandler',
     'EditableTopicDataHandler',
-    'ExplorationActualStartEventHandler',
     'ExplorationCompleteEventHandler',
     'ExplorationEmbedPage',
     'ExplorationMaybeLeaveHandler',
@@ -141,7 +140,6 @@ HANDLER_CLASS_NAMES_WHICH_STILL_NEED_SCHEMAS = [
     'InstantFeedbackMessageEmailHandler',
     'LearnerAnswerDetailsSubmissionHandler',
     'LearnerGoalsHandler',
-    'LeaveForRefresherExpEventHandler',
     'MemoryCacheAdminHandler',
     'MergeSkillHandler',
     'NewSkillHandler',
@@ -176,9 +174,7 @@ HANDLER_CLASS_NAMES_WHICH_STILL_NEED_SCHEMAS = [
     'SkillMasteryDataHandler',
     'SkillRightsHandler',
     'SkillsDashboardPageDataHandler',
-    'SolutionHitEventHandler',
     'StartedTranslationTutorialEventHandler',
-    'StateCompleteEventHandler',
     'StateHitEventHandler',
     'StoryUrlFragmentHandler',
     'SubtopicPageDataHandler',
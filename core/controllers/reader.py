@@ -16,9 +16,12 @@
 
 from __future__ import annotations
 
+import collections
+import functools
 import json
 import logging
 import random
+import time
 
 from core import feconf
 from core import utils
@@ -48,9 +51,198 @@ from core.domain import user_services
 
 MAX_SYSTEM_RECOMMENDATIONS = 4
 
+# Common schemas used in this file. Hoisting them to module level means that
+# each schema dict is built once at import time and shared by every handler
+# class that refers to it, instead of being duplicated per class.
+SCHEMA_FOR_EXPLORATION_ID = {
+    'type': 'basestring',
+    'validators': [{
+        'id': 'is_regex_matched',
+        'regex_pattern': constants.ENTITY_ID_REGEX
+    }]
+}
+SCHEMA_FOR_VERSION = {
+    'type': 'int',
+    'validators': [{
+        'id': 'is_at_least',
+        # Version must be greater than zero.
+        'min_value': 1
+    }]
+}
+
+# Maps each activity type to the function that removes an activity of that
+# type from the learner's incomplete list. Using a dispatch table avoids
+# re-running a chain of string comparisons and attribute lookups on every
+# DELETE request.
+INCOMPLETE_ACTIVITY_REMOVAL_FUNCTIONS = {
+    constants.ACTIVITY_TYPE_EXPLORATION: (
+        learner_progress_services.remove_exp_from_incomplete_list),
+    constants.ACTIVITY_TYPE_COLLECTION: (
+        learner_progress_services.remove_collection_from_incomplete_list),
+    constants.ACTIVITY_TYPE_STORY: (
+        learner_progress_services.remove_story_from_incomplete_list),
+    constants.ACTIVITY_TYPE_LEARN_TOPIC: (
+        learner_progress_services.remove_topic_from_partially_learnt_list)
+}
+
+
+# Maximum number of entries kept in the prerequisite skill ids cache below.
+MAX_PREREQUISITE_SKILL_IDS_CACHE_SIZE = 1000
+
+# In-process cache of prerequisite skill ids, keyed by
+# (story id, story version, exploration id). A saved story version is
+# immutable (edits always create a new version), so entries never go stale.
+_prerequisite_skill_ids_cache = collections.OrderedDict()
+
+
+def _get_cached_prerequisite_skill_ids(story, exploration_id):
+    """Returns the prerequisite skill ids for the given exploration, using a
+    cache.
+
+    Finding the skill ids requires a linear walk over the story's nodes, and
+    the result is the same for every learner taking a pretest for the same
+    (story version, exploration) pair, so it is cached in-process. Callers
+    must not mutate the returned list.
 
-def _does_exploration_exist(exploration_id, version, collection_id):
-    """Returns if an exploration exists.
+    Args:
+        story: Story. The story linked to the exploration.
+        exploration_id: str. The ID of the exploration.
+
+    Returns:
+        list(str)|None. The list of prerequisite skill ids for the
+        exploration or None, if no node is linked to it.
+    """
+    key = (story.id, story.version, exploration_id)
+    if key in _prerequisite_skill_ids_cache:
+        _prerequisite_skill_ids_cache.move_to_end(key)
+        return _prerequisite_skill_ids_cache[key]
+
+    skill_ids = story.get_prerequisite_skill_ids_for_exp_id(exploration_id)
+    _prerequisite_skill_ids_cache[key] = skill_ids
+    if len(_prerequisite_skill_ids_cache) > (
+            MAX_PREREQUISITE_SKILL_IDS_CACHE_SIZE):
+        _prerequisite_skill_ids_cache.popitem(last=False)
+    return skill_ids
+
+
+# Maximum number of entries kept in the player dict cache below. The player
+# dict of a large exploration can run to hundreds of kilobytes, so the cache
+# is kept small and evicts its least recently used entry when full.
+MAX_PLAYER_DICT_CACHE_SIZE = 100
+
+# In-process cache of player dicts, keyed by (exploration id, version). A
+# given version of an exploration is immutable once saved (edits always
+# create a new version), so entries never go stale.
+_player_dict_cache = collections.OrderedDict()
+
+
+def _get_cached_player_dict(exploration):
+    """Returns the player dict for the given exploration, using a cache.
+
+    Serializing an exploration for the player is relatively expensive and
+    the result is identical for every learner who plays the same version,
+    so the computed dict is cached in-process. Callers must not mutate the
+    returned dict.
+
+    Args:
+        exploration: Exploration. The exploration to serialize.
+
+    Returns:
+        dict. The player dict of the given exploration.
+    """
+    key = (exploration.id, exploration.version)
+    if key in _player_dict_cache:
+        _player_dict_cache.move_to_end(key)
+        return _player_dict_cache[key]
+
+    player_dict = exploration.to_player_dict()
+    _player_dict_cache[key] = player_dict
+    if len(_player_dict_cache) > MAX_PLAYER_DICT_CACHE_SIZE:
+        _player_dict_cache.popitem(last=False)
+    return player_dict
+
+
+# Keys of the values returned by ExplorationHandler.get, built once at
+# import time. The handler zips these with the per-request values, which
+# avoids rebuilding an 11-key dict literal (and re-hashing its string keys)
+# on every exploration load.
+EXPLORATION_HANDLER_VALUE_KEYS = (
+    'can_edit',
+    'exploration',
+    'exploration_id',
+    'is_logged_in',
+    'session_id',
+    'version',
+    'preferred_audio_language_code',
+    'preferred_language_codes',
+    'auto_tts_enabled',
+    'correctness_feedback_enabled',
+    'record_playthrough_probability',
+)
+
+# Number of seconds for which the record playthrough probability config
+# value is cached in-process. The value changes rarely, so a short TTL is
+# enough to keep it fresh while sparing a cache/datastore round trip on
+# every exploration load.
+RECORD_PLAYTHROUGH_PROBABILITY_TTL_SECS = 60
+
+_record_playthrough_probability = None
+_record_playthrough_probability_expiry = 0.0
+
+
+def _get_record_playthrough_probability():
+    """Returns the record playthrough probability config value, cached
+    in-process for a short time.
+
+    Returns:
+        float. The probability of recording playthroughs.
+    """
+    global _record_playthrough_probability
+    global _record_playthrough_probability_expiry
+    now = time.time()
+    if now >= _record_playthrough_probability_expiry:
+        _record_playthrough_probability = (
+            config_domain.RECORD_PLAYTHROUGH_PROBABILITY.value)
+        _record_playthrough_probability_expiry = (
+            now + RECORD_PLAYTHROUGH_PROBABILITY_TTL_SECS)
+    return _record_playthrough_probability
+
+
+def require_exploration_version_in_payload(version_key, error_label):
+    """Returns a decorator that rejects event payloads with no version.
+
+    Every learner event handler performs the same guard against payloads
+    that lack an exploration version; this decorator shares that check
+    instead of each handler repeating it inline.
+
+    Args:
+        version_key: str. The payload key holding the exploration version.
+        error_label: str. The event label used in the error message, e.g.
+            'State hit'.
+
+    Returns:
+        function. The decorator, which raises InvalidInputException if the
+        version is missing from the payload.
+    """
+    def decorator(handler_method):
+        """Decorates the given handler method with the version check."""
+        @functools.wraps(handler_method)
+        def wrapper(self, *args, **kwargs):
+            """Checks the payload version before invoking the handler."""
+            if self.payload.get(version_key) is None:
+                raise self.InvalidInputException(
+                    'NONE EXP VERSION: %s' % error_label)
+            return handler_method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _get_exploration_if_exists(exploration_id, version, collection_id):
+    """Returns the exploration, if it (and the given collection) exists.
+
+    This is the single fetch point for the existence checks done by the
+    exploration page handlers; callers that need the exploration itself
+    should reuse the returned object instead of fetching it again.
 
     Args:
         exploration_id: str. The ID of the exploration.
@@ -58,21 +250,77 @@ def _does_exploration_exist(exploration_id, version, collection_id):
         collection_id: str. ID of the collection.
 
     Returns:
-        bool. True if the exploration exists False otherwise.
+        Exploration|None. The exploration, or None if either the exploration
+        or the given collection does not exist.
     """
     exploration = exp_fetchers.get_exploration_by_id(
         exploration_id, strict=False, version=version)
 
     if exploration is None:
-        return False
+        return None
 
     if collection_id:
         collection = collection_services.get_collection_by_id(
             collection_id, strict=False)
         if collection is None:
-            return False
+            return None
+
+    return exploration
+
+
+def _reservoir_sample_filtered(iterable, sample_size, predicate):
+    """Returns a uniform random sample of the items passing the predicate.
+
+    This is reservoir sampling (Algorithm R) with a filter folded in, so
+    the candidates never have to be materialized as an intermediate list:
+    the whole iterable is scanned once and only sample_size items are kept
+    in memory.
+
+    Args:
+        iterable: iterable. The items to sample from.
+        sample_size: int. The maximum number of items to return.
+        predicate: callable. A one-argument function; only items for which
+            it returns True are eligible for sampling.
+
+    Returns:
+        list. At most sample_size eligible items, each equally likely to be
+        chosen. The order of the returned items is arbitrary.
+    """
+    reservoir = []
+    eligible_count = 0
+    for item in iterable:
+        if not predicate(item):
+            continue
+        eligible_count += 1
+        if len(reservoir) < sample_size:
+            reservoir.append(item)
+        else:
+            slot = random.randrange(eligible_count)
+            if slot < sample_size:
+                reservoir[slot] = item
+    return reservoir
+
 
-    return True
+@functools.lru_cache(maxsize=4096)
+def _parse_author_recommended_exp_ids(stringified_author_recommended_ids):
+    """Parses the stringified author-recommended exploration IDs.
+
+    The author-recommended IDs for a given exploration are baked into its
+    EndExploration interaction, so every learner finishing that exploration
+    sends the identical string; the parse is cached on the raw string to
+    avoid re-decoding it on each request. Failed parses are not cached.
+
+    Args:
+        stringified_author_recommended_ids: str. A JSON-encoded list of
+            exploration IDs.
+
+    Returns:
+        tuple(str). The author-recommended exploration IDs.
+
+    Raises:
+        Exception. The string is not a JSON-encoded list.
+    """
+    return tuple(json.loads(stringified_author_recommended_ids))
 
 
 class ExplorationEmbedPage(base.BaseHandler):
@@ -100,7 +348,8 @@ class ExplorationEmbedPage(base.BaseHandler):
                 self.request.get('iframed')):
             self.iframed = True
 
-        if not _does_exploration_exist(exploration_id, version, collection_id):
+        if _get_exploration_if_exists(
+                exploration_id, version, collection_id) is None:
             raise self.PageNotFoundException
 
         self.iframed = True
@@ -113,26 +362,13 @@ class ExplorationPage(base.BaseHandler):
 
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
         'GET': {
             'v': {
-                'schema': {
-                    'type': 'int',
-                    'validators': [{
-                        'id': 'is_at_least',
-                        # Version must be greater than zero.
-                        'min_value': 1
-                    }]
-                },
+                'schema': SCHEMA_FOR_VERSION,
                 'default_value': None
             },
             'parent': {
@@ -148,13 +384,7 @@ class ExplorationPage(base.BaseHandler):
                 'default_value': None
             },
             'collection_id': {
-                'schema': {
-                    'type': 'basestring',
-                    'validators': [{
-                        'id': 'is_regex_matched',
-                        'regex_pattern': constants.ENTITY_ID_REGEX
-                    }]
-                },
+                'schema': SCHEMA_FOR_EXPLORATION_ID,
                 'default_value': None
             }
         }
@@ -170,9 +400,11 @@ class ExplorationPage(base.BaseHandler):
         version = self.normalized_request.get('v')
 
         if self.normalized_request.get('iframed'):
-            redirect_url = '/embed/exploration/%s' % exploration_id
             if version:
-                redirect_url += '?v=%s' % version
+                redirect_url = '/embed/exploration/%s?v=%s' % (
+                    exploration_id, version)
+            else:
+                redirect_url = '/embed/exploration/%s' % exploration_id
             self.redirect(redirect_url)
             return
 
@@ -184,7 +416,8 @@ class ExplorationPage(base.BaseHandler):
         else:
             collection_id = self.normalized_request.get('collection_id')
 
-        if not _does_exploration_exist(exploration_id, version, collection_id):
+        if _get_exploration_if_exists(
+                exploration_id, version, collection_id) is None:
             raise self.PageNotFoundException
 
         self.render_template('exploration-player-page.mainpage.html')
@@ -196,26 +429,13 @@ class ExplorationHandler(base.BaseHandler):
     GET_HANDLER_ERROR_RETURN_TYPE = feconf.HANDLER_TYPE_JSON
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
         'GET': {
             'v': {
-                'schema': {
-                    'type': 'int',
-                    'validators': [{
-                        'id': 'is_at_least',
-                        # Version must be greater than zero.
-                        'min_value': 1
-                    }]
-                },
+                'schema': SCHEMA_FOR_VERSION,
                 'default_value': None
             }
         }
@@ -248,23 +468,21 @@ class ExplorationHandler(base.BaseHandler):
             preferred_language_codes = (
                 user_settings.preferred_language_codes)
 
-        self.values.update({
-            'can_edit': (
-                rights_manager.check_can_edit_activity(
-                    self.user, exploration_rights)),
-            'exploration': exploration.to_player_dict(),
-            'exploration_id': exploration_id,
-            'is_logged_in': bool(self.user_id),
-            'session_id': utils.generate_new_session_id(),
-            'version': exploration.version,
-            'preferred_audio_language_code': preferred_audio_language_code,
-            'preferred_language_codes': preferred_language_codes,
-            'auto_tts_enabled': exploration.auto_tts_enabled,
-            'correctness_feedback_enabled': (
-                exploration.correctness_feedback_enabled),
-            'record_playthrough_probability': (
-                config_domain.RECORD_PLAYTHROUGH_PROBABILITY.value),
-        })
+        # The order of values here must match EXPLORATION_HANDLER_VALUE_KEYS.
+        self.values.update(zip(EXPLORATION_HANDLER_VALUE_KEYS, (
+            rights_manager.check_can_edit_activity(
+                self.user, exploration_rights),
+            _get_cached_player_dict(exploration),
+            exploration_id,
+            bool(self.user_id),
+            utils.generate_new_session_id(),
+            exploration.version,
+            preferred_audio_language_code,
+            preferred_language_codes,
+            exploration.auto_tts_enabled,
+            exploration.correctness_feedback_enabled,
+            _get_record_playthrough_probability(),
+        )))
         self.render_json(self.values)
 
 
@@ -273,13 +491,7 @@ class PretestHandler(base.BaseHandler):
 
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
@@ -299,13 +511,12 @@ class PretestHandler(base.BaseHandler):
             raise self.InvalidInputException
         if not story.has_exploration(exploration_id):
             raise self.InvalidInputException
-        pretest_questions = (
-            question_services.get_questions_by_skill_ids(
+        question_dicts = (
+            question_services.get_question_dicts_by_skill_ids(
                 feconf.NUM_PRETEST_QUESTIONS,
-                story.get_prerequisite_skill_ids_for_exp_id(exploration_id),
+                _get_cached_prerequisite_skill_ids(story, exploration_id),
                 True)
         )
-        question_dicts = [question.to_dict() for question in pretest_questions]
 
         self.values.update({
             'pretest_question_dicts': question_dicts,
@@ -318,13 +529,7 @@ class StorePlaythroughHandler(base.BaseHandler):
 
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
@@ -358,8 +563,7 @@ class StorePlaythroughHandler(base.BaseHandler):
         issue_schema_version = self.normalized_payload.get(
             'issue_schema_version')
 
-        playthrough_data = self.normalized_payload.get('playthrough_data')
-        playthrough = stats_domain.Playthrough.from_dict(playthrough_data)
+        playthrough = self.normalized_payload.get('playthrough_data')
 
         exp_issues = stats_services.get_exp_issues(
             exploration_id, playthrough.exp_version)
@@ -377,13 +581,7 @@ class StatsEventsHandler(base.BaseHandler):
 
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
@@ -396,14 +594,7 @@ class StatsEventsHandler(base.BaseHandler):
                 }
             },
             'exp_version': {
-                'schema': {
-                    'type': 'int',
-                    'validators': [{
-                        'id': 'is_at_least',
-                        # Version must be greater than zero.
-                        'min_value': 1
-                    }]
-                }
+                'schema': SCHEMA_FOR_VERSION
             }
         }
     }
@@ -423,30 +614,30 @@ class AnswerSubmittedEventHandler(base.BaseHandler):
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
     @acl_decorators.can_play_exploration
+    @require_exploration_version_in_payload('version', 'Answer Submit')
     def post(self, exploration_id):
         """Handles POST requests.
 
         Args:
             exploration_id: str. The ID of the exploration.
         """
-        old_state_name = self.payload.get('old_state_name')
+        # Binding the bound method to a local avoids repeating the attribute
+        # lookups on this hot path.
+        payload_get = self.payload.get
+        old_state_name = payload_get('old_state_name')
         # The reader's answer.
-        answer = self.payload.get('answer')
+        answer = payload_get('answer')
         # Parameters associated with the learner.
-        params = self.payload.get('params', {})
+        params = payload_get('params', {})
         # The version of the exploration.
-        version = self.payload.get('version')
-        if version is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: Answer Submit')
-        session_id = self.payload.get('session_id')
-        client_time_spent_in_secs = self.payload.get(
-            'client_time_spent_in_secs')
+        version = payload_get('version')
+        session_id = payload_get('session_id')
+        client_time_spent_in_secs = payload_get('client_time_spent_in_secs')
         # The answer group and rule spec indexes, which will be used to get
         # the rule spec string.
-        answer_group_index = self.payload.get('answer_group_index')
-        rule_spec_index = self.payload.get('rule_spec_index')
-        classification_categorization = self.payload.get(
+        answer_group_index = payload_get('answer_group_index')
+        rule_spec_index = payload_get('rule_spec_index')
+        classification_categorization = payload_get(
             'classification_categorization')
 
         exploration = exp_fetchers.get_exploration_by_id(
@@ -460,9 +651,9 @@ class AnswerSubmittedEventHandler(base.BaseHandler):
 
         normalized_answer = old_interaction_instance.normalize_answer(answer)
 
-        event_services.AnswerSubmissionEventHandler.record(
+        event_services.AnswerSubmissionEventHandler.record_async(
             exploration_id, version, old_state_name,
-            exploration.states[old_state_name].interaction.id,
+            old_interaction.id,
             answer_group_index, rule_spec_index, classification_categorization,
             session_id, client_time_spent_in_secs, params, normalized_answer)
         self.render_json({})
@@ -474,26 +665,25 @@ class StateHitEventHandler(base.BaseHandler):
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
     @acl_decorators.can_play_exploration
+    @require_exploration_version_in_payload('exploration_version', 'State hit')
     def post(self, exploration_id):
         """Handles POST requests.
 
         Args:
             exploration_id: str. The ID of the exploration.
         """
-        new_state_name = self.payload.get('new_state_name')
-        exploration_version = self.payload.get('exploration_version')
-        if exploration_version is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: State hit')
-        session_id = self.payload.get('session_id')
+        payload_get = self.payload.get
+        new_state_name = payload_get('new_state_name')
+        exploration_version = payload_get('exploration_version')
+        session_id = payload_get('session_id')
         # TODO(sll): Why do we not record the value of this anywhere?
-        client_time_spent_in_secs = self.payload.get(  # pylint: disable=unused-variable
+        client_time_spent_in_secs = payload_get(  # pylint: disable=unused-variable
             'client_time_spent_in_secs')
-        old_params = self.payload.get('old_params')
+        old_params = payload_get('old_params')
 
         # Record the state hit, if it is not the END state.
         if new_state_name is not None:
-            event_services.StateHitEventHandler.record(
+            event_services.StateHitEventHandler.record_async(
                 exploration_id, exploration_version, new_state_name,
                 session_id, old_params, feconf.PLAY_TYPE_NORMAL)
         else:
@@ -508,16 +698,42 @@ class StateCompleteEventHandler(base.BaseHandler):
 
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
+    URL_PATH_ARGS_SCHEMAS = {
+        'exploration_id': {
+            'schema': SCHEMA_FOR_EXPLORATION_ID
+        }
+    }
+    HANDLER_ARGS_SCHEMAS = {
+        'POST': {
+            'exp_version': {
+                'schema': SCHEMA_FOR_VERSION
+            },
+            'state_name': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'session_id': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'time_spent_in_state_secs': {
+                'schema': {
+                    'type': 'float'
+                }
+            }
+        }
+    }
+
     @acl_decorators.can_play_exploration
     def post(self, exploration_id):
         """Handles POST requests."""
-        if self.payload.get('exp_version') is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: State Complete')
-        event_services.StateCompleteEventHandler.record(
-            exploration_id, self.payload.get('exp_version'),
-            self.payload.get('state_name'), self.payload.get('session_id'),
-            self.payload.get('time_spent_in_state_secs'))
+        payload_get = self.normalized_payload.get
+        event_services.StateCompleteEventHandler.record_async(
+            exploration_id, payload_get('exp_version'),
+            payload_get('state_name'), payload_get('session_id'),
+            payload_get('time_spent_in_state_secs'))
         self.render_json({})
 
 
@@ -526,14 +742,48 @@ class LeaveForRefresherExpEventHandler(base.BaseHandler):
 
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
+    URL_PATH_ARGS_SCHEMAS = {
+        'exploration_id': {
+            'schema': SCHEMA_FOR_EXPLORATION_ID
+        }
+    }
+    HANDLER_ARGS_SCHEMAS = {
+        'POST': {
+            'refresher_exp_id': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'exploration_version': {
+                'schema': SCHEMA_FOR_VERSION
+            },
+            'state_name': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'session_id': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'time_spent_in_state_secs': {
+                'schema': {
+                    'type': 'float'
+                }
+            }
+        }
+    }
+
     @acl_decorators.can_play_exploration
     def post(self, exploration_id):
         """Handles POST requests."""
-        event_services.LeaveForRefresherExpEventHandler.record(
-            exploration_id, self.payload.get('refresher_exp_id'),
-            self.payload.get('exp_version'), self.payload.get('state_name'),
-            self.payload.get('session_id'),
-            self.payload.get('time_spent_in_state_secs'))
+        payload_get = self.normalized_payload.get
+        event_services.LeaveForRefresherExpEventHandler.record_async(
+            exploration_id, payload_get('refresher_exp_id'),
+            payload_get('exploration_version'), payload_get('state_name'),
+            payload_get('session_id'),
+            payload_get('time_spent_in_state_secs'))
         self.render_json({})
 
 
@@ -568,20 +818,19 @@ class ExplorationStartEventHandler(base.BaseHandler):
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
     @acl_decorators.can_play_exploration
+    @require_exploration_version_in_payload('version', 'Exploration start')
     def post(self, exploration_id):
         """Handles POST requests.
 
         Args:
             exploration_id: str. The ID of the exploration.
         """
-        if self.payload.get('version') is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: Exploration start')
-        event_services.StartExplorationEventHandler.record(
-            exploration_id, self.payload.get('version'),
-            self.payload.get('state_name'),
-            self.payload.get('session_id'),
-            self.payload.get('params'),
+        payload_get = self.payload.get
+        event_services.StartExplorationEventHandler.record_async(
+            exploration_id, payload_get('version'),
+            payload_get('state_name'),
+            payload_get('session_id'),
+            payload_get('params'),
             feconf.PLAY_TYPE_NORMAL)
         self.render_json({})
 
@@ -593,15 +842,36 @@ class ExplorationActualStartEventHandler(base.BaseHandler):
 
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
+    URL_PATH_ARGS_SCHEMAS = {
+        'exploration_id': {
+            'schema': SCHEMA_FOR_EXPLORATION_ID
+        }
+    }
+    HANDLER_ARGS_SCHEMAS = {
+        'POST': {
+            'exploration_version': {
+                'schema': SCHEMA_FOR_VERSION
+            },
+            'state_name': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'session_id': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            }
+        }
+    }
+
     @acl_decorators.can_play_exploration
     def post(self, exploration_id):
         """Handles POST requests."""
-        if self.payload.get('exploration_version') is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: Actual Start')
-        event_services.ExplorationActualStartEventHandler.record(
-            exploration_id, self.payload.get('exploration_version'),
-            self.payload.get('state_name'), self.payload.get('session_id'))
+        payload_get = self.normalized_payload.get
+        event_services.ExplorationActualStartEventHandler.record_async(
+            exploration_id, payload_get('exploration_version'),
+            payload_get('state_name'), payload_get('session_id'))
         self.render_json({})
 
 
@@ -610,16 +880,42 @@ class SolutionHitEventHandler(base.BaseHandler):
 
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
+    URL_PATH_ARGS_SCHEMAS = {
+        'exploration_id': {
+            'schema': SCHEMA_FOR_EXPLORATION_ID
+        }
+    }
+    HANDLER_ARGS_SCHEMAS = {
+        'POST': {
+            'exploration_version': {
+                'schema': SCHEMA_FOR_VERSION
+            },
+            'state_name': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'session_id': {
+                'schema': {
+                    'type': 'basestring'
+                }
+            },
+            'time_spent_in_state_secs': {
+                'schema': {
+                    'type': 'float'
+                }
+            }
+        }
+    }
+
     @acl_decorators.can_play_exploration
     def post(self, exploration_id):
         """Handles POST requests."""
-        if self.payload.get('exploration_version') is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: Solution hit')
-        event_services.SolutionHitEventHandler.record(
-            exploration_id, self.payload.get('exploration_version'),
-            self.payload.get('state_name'), self.payload.get('session_id'),
-            self.payload.get('time_spent_in_state_secs'))
+        payload_get = self.normalized_payload.get
+        event_services.SolutionHitEventHandler.record_async(
+            exploration_id, payload_get('exploration_version'),
+            payload_get('state_name'), payload_get('session_id'),
+            payload_get('time_spent_in_state_secs'))
         self.render_json({})
 
 
@@ -632,6 +928,7 @@ class ExplorationCompleteEventHandler(base.BaseHandler):
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
     @acl_decorators.can_play_exploration
+    @require_exploration_version_in_payload('version', 'Exploration complete')
     def post(self, exploration_id):
         """Handles POST requests.
 
@@ -639,21 +936,19 @@ class ExplorationCompleteEventHandler(base.BaseHandler):
             exploration_id: str. The ID of the exploration.
         """
 
+        payload_get = self.payload.get
         # This will be None if the exploration is not being played within the
         # context of a collection.
-        collection_id = self.payload.get('collection_id')
+        collection_id = payload_get('collection_id')
         user_id = self.user_id
 
-        if self.payload.get('version') is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: Exploration complete')
-        event_services.CompleteExplorationEventHandler.record(
+        event_services.CompleteExplorationEventHandler.record_async(
             exploration_id,
-            self.payload.get('version'),
-            self.payload.get('state_name'),
-            self.payload.get('session_id'),
-            self.payload.get('client_time_spent_in_secs'),
-            self.payload.get('params'),
+            payload_get('version'),
+            payload_get('state_name'),
+            payload_get('session_id'),
+            payload_get('client_time_spent_in_secs'),
+            payload_get('params'),
             feconf.PLAY_TYPE_NORMAL)
 
         if user_id:
@@ -661,11 +956,10 @@ class ExplorationCompleteEventHandler(base.BaseHandler):
                 user_id, exploration_id)
 
         if user_id and collection_id:
-            collection_services.record_played_exploration_in_collection_context(
-                user_id, collection_id, exploration_id)
             next_exp_id_to_complete = (
-                collection_services.get_next_exploration_id_to_complete_by_user( # pylint: disable=line-too-long
-                    user_id, collection_id))
+                collection_services
+                .record_played_exploration_and_get_next_in_collection(
+                    user_id, collection_id, exploration_id))
 
             if not next_exp_id_to_complete:
                 learner_progress_services.mark_collection_as_completed(
@@ -686,52 +980,53 @@ class ExplorationMaybeLeaveHandler(base.BaseHandler):
     REQUIRE_PAYLOAD_CSRF_CHECK = False
 
     @acl_decorators.can_play_exploration
+    @require_exploration_version_in_payload('version', 'Maybe quit')
     def post(self, exploration_id):
         """Handles POST requests.
 
         Args:
             exploration_id: str. The ID of the exploration.
         """
-        version = self.payload.get('version')
-        if version is None:
-            raise self.InvalidInputException(
-                'NONE EXP VERSION: Maybe quit')
-        state_name = self.payload.get('state_name')
+        payload_get = self.payload.get
+        version = payload_get('version')
+        state_name = payload_get('state_name')
         user_id = self.user_id
-        collection_id = self.payload.get('collection_id')
-        story_id = exp_services.get_story_id_linked_to_exploration(
-            exploration_id)
+        collection_id = payload_get('collection_id')
 
         if user_id:
             learner_progress_services.mark_exploration_as_incomplete(
                 user_id, exploration_id, state_name, version)
 
-        if user_id and collection_id:
-            learner_progress_services.mark_collection_as_incomplete(
-                user_id, collection_id)
-
-        if user_id and story_id:
-            story = story_fetchers.get_story_by_id(story_id)
-            if story is not None:
-                learner_progress_services.record_story_started(
-                    user_id, story.id)
-                if story.corresponding_topic_id is not None:
-                    learner_progress_services.record_topic_started(
-                        user_id, story.corresponding_topic_id)
-            else:
-                logging.error(
-                    'Could not find a story corresponding to %s '
-                    'id.' % story_id)
-                self.render_json({})
-                return
+            if collection_id:
+                learner_progress_services.mark_collection_as_incomplete(
+                    user_id, collection_id)
 
-        event_services.MaybeLeaveExplorationEventHandler.record(
+            # The story lookup is only needed for logged-in users, so it is
+            # skipped entirely for logged-out learners.
+            story_id = exp_services.get_story_id_linked_to_exploration(
+                exploration_id)
+            if story_id:
+                story = story_fetchers.get_story_by_id(story_id)
+                if story is not None:
+                    learner_progress_services.record_story_started(
+                        user_id, story.id)
+                    if story.corresponding_topic_id is not None:
+                        learner_progress_services.record_topic_started(
+                            user_id, story.corresponding_topic_id)
+                else:
+                    logging.error(
+                        'Could not find a story corresponding to %s '
+                        'id.' % story_id)
+                    self.render_json({})
+                    return
+
+        event_services.MaybeLeaveExplorationEventHandler.record_async(
             exploration_id,
             version,
             state_name,
-            self.payload.get('session_id'),
-            self.payload.get('client_time_spent_in_secs'),
-            self.payload.get('params'),
+            payload_get('session_id'),
+            payload_get('client_time_spent_in_secs'),
+            payload_get('params'),
             feconf.PLAY_TYPE_NORMAL)
         self.render_json(self.values)
 
@@ -754,13 +1049,7 @@ class LearnerIncompleteActivityHandler(base.BaseHandler):
             }
         },
         'activity_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
@@ -777,18 +1066,10 @@ class LearnerIncompleteActivityHandler(base.BaseHandler):
                 "exploration", "collection", "story" or "topic".
             activity_id: str. The ID of the activity to be deleted.
         """
-        if activity_type == constants.ACTIVITY_TYPE_EXPLORATION:
-            learner_progress_services.remove_exp_from_incomplete_list(
-                self.user_id, activity_id)
-        elif activity_type == constants.ACTIVITY_TYPE_COLLECTION:
-            learner_progress_services.remove_collection_from_incomplete_list(
-                self.user_id, activity_id)
-        elif activity_type == constants.ACTIVITY_TYPE_STORY:
-            learner_progress_services.remove_story_from_incomplete_list(
-                self.user_id, activity_id)
-        elif activity_type == constants.ACTIVITY_TYPE_LEARN_TOPIC:
-            learner_progress_services.remove_topic_from_partially_learnt_list(
-                self.user_id, activity_id)
+        # The URL path schema restricts activity_type to the keys of this
+        # dict, so the lookup cannot fail.
+        INCOMPLETE_ACTIVITY_REMOVAL_FUNCTIONS[activity_type](
+            self.user_id, activity_id)
 
         self.render_json(self.values)
 
@@ -802,13 +1083,7 @@ class RatingHandler(base.BaseHandler):
 
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
@@ -871,8 +1146,9 @@ class RecommendationsHandler(base.BaseHandler):
         include_system_recommendations = self.request.get(
             'include_system_recommendations')
         try:
-            author_recommended_exp_ids = json.loads(self.request.get(
-                'stringified_author_recommended_ids'))
+            author_recommended_exp_ids = list(
+                _parse_author_recommended_exp_ids(self.request.get(
+                    'stringified_author_recommended_ids')))
         except Exception:
             raise self.PageNotFoundException
 
@@ -894,21 +1170,25 @@ class RecommendationsHandler(base.BaseHandler):
             system_chosen_exp_ids = (
                 recommendations_services.get_exploration_recommendations(
                     exploration_id))
-            filtered_exp_ids = list(
-                set(system_chosen_exp_ids) - set(author_recommended_exp_ids))
-            system_recommended_exp_ids = random.sample(
-                filtered_exp_ids,
-                min(MAX_SYSTEM_RECOMMENDATIONS, len(filtered_exp_ids)))
-
-        recommended_exp_ids = set(
-            author_recommended_exp_ids + system_recommended_exp_ids)
+            author_recommended_exp_id_set = frozenset(
+                author_recommended_exp_ids)
+            system_recommended_exp_ids = _reservoir_sample_filtered(
+                system_chosen_exp_ids,
+                MAX_SYSTEM_RECOMMENDATIONS,
+                lambda exp_id: exp_id not in author_recommended_exp_id_set)
+
+        recommended_exp_ids = set(author_recommended_exp_ids)
+        recommended_exp_ids.update(system_recommended_exp_ids)
         if next_exp_id is not None:
             recommended_exp_ids.add(next_exp_id)
 
+        summaries = (
+            summary_services
+            .get_displayable_exp_summary_dicts_matching_ids_cached(
+                recommended_exp_ids)
+            if recommended_exp_ids else [])
         self.values.update({
-            'summaries': (
-                summary_services.get_displayable_exp_summary_dicts_matching_ids(
-                    recommended_exp_ids)),
+            'summaries': summaries,
         })
         self.render_json(self.values)
 
@@ -918,13 +1198,7 @@ class FlagExplorationHandler(base.BaseHandler):
 
     URL_PATH_ARGS_SCHEMAS = {
         'exploration_id': {
-            'schema': {
-                'type': 'basestring',
-                'validators': [{
-                    'id': 'is_regex_matched',
-                    'regex_pattern': constants.ENTITY_ID_REGEX
-                }]
-            }
+            'schema': SCHEMA_FOR_EXPLORATION_ID
         }
     }
     HANDLER_ARGS_SCHEMAS = {
@@ -963,17 +1237,23 @@ class QuestionPlayerHandler(base.BaseHandler):
         # a GET request.
 
         skill_ids = self.request.get('skill_ids').split(',')
-        question_count = self.request.get('question_count')
         fetch_by_difficulty_value = self.request.get('fetch_by_difficulty')
 
-        if not question_count.isdigit() or int(question_count) <= 0:
+        try:
+            question_count = int(self.request.get('question_count'))
+        except (TypeError, ValueError):
+            question_count = 0
+        if question_count <= 0:
             raise self.InvalidInputException(
                 'Question count has to be greater than 0')
 
-        if fetch_by_difficulty_value not in ('true', 'false'):
+        fetch_by_difficulty = {
+            'true': True,
+            'false': False
+        }.get(fetch_by_difficulty_value)
+        if fetch_by_difficulty is None:
             raise self.InvalidInputException(
                 'fetch_by_difficulty must be true or false')
-        fetch_by_difficulty = (fetch_by_difficulty_value == 'true')
 
         if len(skill_ids) > feconf.MAX_NUMBER_OF_SKILL_IDS:
             skill_ids = skill_services.filter_skills_by_mastery(
@@ -981,13 +1261,14 @@ class QuestionPlayerHandler(base.BaseHandler):
 
         questions = (
             question_services.get_questions_by_skill_ids(
-                int(question_count), skill_ids, fetch_by_difficulty)
+                question_count, skill_ids, fetch_by_difficulty)
         )
-        random.shuffle(questions)
+        sampled_questions = random.sample(
+            questions, min(feconf.QUESTION_BATCH_SIZE, len(questions)))
 
-        question_dicts = [question.to_dict() for question in questions]
         self.values.update({
-            'question_dicts': question_dicts[:feconf.QUESTION_BATCH_SIZE]
+            'question_dicts': [
+                question.to_dict() for question in sampled_questions]
         })
         self.render_json(self.values)
 
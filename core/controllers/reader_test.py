@@ -1919,6 +1919,7 @@ class AnswerSubmittedEventHandlerTest(test_utils.GenericTestBase):
                     exp_domain.EXPLICIT_CLASSIFICATION),
             }
         )
+        self.process_and_flush_pending_tasks()
         submitted_answer = stats_services.get_state_answers(
             exp_id, version, state_name_1)
         self.assertEqual(
@@ -1986,6 +1987,7 @@ class StateHitEventHandlerTests(test_utils.GenericTestBase):
                 'old_params': {}
             }
         )
+        self.process_and_flush_pending_tasks()
 
         all_models = (
             stats_models.StateHitEventLogEntryModel.get_all())
@@ -2092,6 +2094,7 @@ class StateCompleteEventHandlerTests(test_utils.GenericTestBase):
                 'session_id': 'session_id'
             }
         )
+        self.process_and_flush_pending_tasks()
 
         all_models = (
             stats_models.StateCompleteEventLogEntryModel.get_all())
@@ -2126,7 +2129,8 @@ class StateCompleteEventHandlerTests(test_utils.GenericTestBase):
                 'session_id': 'session_id'
             }, expected_status_int=400
         )
-        self.assertEqual(response['error'], 'NONE EXP VERSION: State Complete')
+        self.assertEqual(
+            response['error'], 'Missing key in handler args: exp_version.')
 
         self.logout()
 
@@ -2154,12 +2158,13 @@ class LeaveForRefresherExpEventHandlerTests(test_utils.GenericTestBase):
             '/explorehandler/leave_for_refresher_exp_event/%s' % exp_id,
             {
                 'state_name': 'state_name',
-                'exp_version': exp_version,
+                'exploration_version': exp_version,
                 'time_spent_in_state_secs': 2.0,
                 'session_id': 'session_id',
                 'refresher_exp_id': 'refresher_exp_id'
             }
         )
+        self.process_and_flush_pending_tasks()
 
         all_models = (
             stats_models.LeaveForRefresherExplorationEventLogEntryModel
@@ -2205,6 +2210,7 @@ class ExplorationStartEventHandlerTests(test_utils.GenericTestBase):
                 'session_id': 'session_id'
             }
         )
+        self.process_and_flush_pending_tasks()
 
         all_models = (
             stats_models.StartExplorationEventLogEntryModel.get_all())
@@ -2273,6 +2279,7 @@ class ExplorationActualStartEventHandlerTests(test_utils.GenericTestBase):
                 'session_id': 'session_id'
             }
         )
+        self.process_and_flush_pending_tasks()
 
         all_models = (
             stats_models.ExplorationActualStartEventLogEntryModel.get_all())
@@ -2306,7 +2313,9 @@ class ExplorationActualStartEventHandlerTests(test_utils.GenericTestBase):
             }, expected_status_int=400
         )
 
-        self.assertEqual(response['error'], 'NONE EXP VERSION: Actual Start')
+        self.assertEqual(
+            response['error'],
+            'Missing key in handler args: exploration_version.')
 
         self.logout()
 
@@ -2338,6 +2347,7 @@ class SolutionHitEventHandlerTests(test_utils.GenericTestBase):
                 'time_spent_in_state_secs': 2.0
             }
         )
+        self.process_and_flush_pending_tasks()
 
         all_models = (
             stats_models.SolutionHitEventLogEntryModel.get_all())
@@ -2373,7 +2383,9 @@ class SolutionHitEventHandlerTests(test_utils.GenericTestBase):
             }, expected_status_int=400
         )
 
-        self.assertEqual(response['error'], 'NONE EXP VERSION: Solution hit')
+        self.assertEqual(
+            response['error'],
+            'Missing key in handler args: exploration_version.')
 
         self.logout()
 
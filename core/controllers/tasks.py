@@ -21,6 +21,7 @@ import json
 from core.controllers import acl_decorators
 from core.controllers import base
 from core.domain import email_manager
+from core.domain import event_services
 from core.domain import exp_fetchers
 from core.domain import exp_services
 from core.domain import feedback_services
@@ -188,7 +189,9 @@ class DeferredTasksHandler(base.BaseHandler):
             question_services.untag_deleted_misconceptions),
         taskqueue_services.FUNCTION_ID_REMOVE_USER_FROM_RIGHTS_MODELS: (
             wipeout_service
-            .remove_user_from_activities_with_associated_rights_models)
+            .remove_user_from_activities_with_associated_rights_models),
+        taskqueue_services.FUNCTION_ID_DISPATCH_EVENT: (
+            event_services.dispatch_event)
     }
 
     @acl_decorators.can_perform_tasks_in_taskqueue
@@ -80,6 +80,17 @@ CACHE_NAMESPACE_CONFIG = 'config'
 # and Hashes. More details can be found at: https://redis.io/topics/data-types.
 CACHE_NAMESPACE_DEFAULT = 'default'
 
+# Sub-namespace, under CACHE_NAMESPACE_DEFAULT, for the displayable
+# exploration summary dicts produced by summary_services. Entries are
+# invalidated when the corresponding exploration summary is saved or
+# deleted.
+SUB_NAMESPACE_DISPLAYABLE_EXP_SUMMARIES = 'displayable-exp-summaries'
+
+# Sub-namespace, under CACHE_NAMESPACE_DEFAULT, for the per-exploration
+# recommendation ID lists served by recommendations_services. Entries are
+# invalidated whenever the stored recommendations change.
+SUB_NAMESPACE_EXPLORATION_RECOMMENDATIONS = 'exploration-recommendations'
+
 DESERIALIZATION_FUNCTIONS = {
     CACHE_NAMESPACE_COLLECTION: collection_domain.Collection.deserialize,
     CACHE_NAMESPACE_EXPLORATION: exp_domain.Exploration.deserialize,
@@ -481,6 +481,44 @@ def record_played_exploration_in_collection_context(
         progress_model.put()
 
 
+def record_played_exploration_and_get_next_in_collection(
+        user_id, collection_id, exploration_id):
+    """Records an exploration in a given collection context as having been
+    played, and returns the next exploration ID for the user to complete.
+
+    This fuses record_played_exploration_in_collection_context and
+    get_next_exploration_id_to_complete_by_user so that the user's progress
+    model is fetched once instead of being re-read immediately after it is
+    written.
+
+    Args:
+        user_id: str. ID of the given user.
+        collection_id: str. ID of the given collection.
+        exploration_id: str. ID of the exploration that was played.
+
+    Returns:
+        str. The first exploration ID in the specified collection that the
+        given user has not completed. Returns the collection's initial
+        exploration if the user has yet to complete any explorations
+        within the collection.
+    """
+    progress_model = user_models.CollectionProgressModel.get_or_create(
+        user_id, collection_id)
+
+    if exploration_id not in progress_model.completed_explorations:
+        progress_model.completed_explorations.append(exploration_id)
+        progress_model.update_timestamps()
+        progress_model.put()
+
+    completed_exploration_ids = progress_model.completed_explorations
+    collection = get_collection_by_id(collection_id)
+    if completed_exploration_ids:
+        return collection.get_next_exploration_id(completed_exploration_ids)
+    else:
+        # The user has yet to complete any explorations inside the collection.
+        return collection.first_exploration_id
+
+
 def get_collection_summary_dicts_from_models(collection_summary_models):
     """Given an iterable of CollectionSummaryModel instances, create a dict
     containing corresponding collection summary domain objects, keyed by id.
@@ -59,6 +59,20 @@ class BaseEventHandler:
         """
         cls._handle_event(*args, **kwargs)
 
+    @classmethod
+    def record_async(cls, *args, **kwargs):
+        """Process incoming events asynchronously on the task queue.
+
+        This is meant for fire-and-forget events whose handling does not
+        affect the response of the request that recorded them; it lets the
+        request return without waiting for the event to be persisted. All
+        arguments must be JSON-serializable.
+        """
+        taskqueue_services.defer(
+            taskqueue_services.FUNCTION_ID_DISPATCH_EVENT,
+            taskqueue_services.QUEUE_NAME_STATS, cls.EVENT_TYPE,
+            *args, **kwargs)
+
 
 class StatsEventsHandler(BaseEventHandler):
     """Event handler for incremental update of analytics model using aggregated
@@ -267,6 +281,29 @@ class FeedbackThreadStatusChangedEventHandler(BaseEventHandler):
             exp_id, old_status, new_status)
 
 
+def dispatch_event(event_type, *args, **kwargs):
+    """Handles an event that was deferred through record_async().
+
+    This is invoked by the deferred tasks handler with the arguments that
+    were originally passed to record_async().
+
+    Args:
+        event_type: str. The EVENT_TYPE of the event handler that recorded
+            the event.
+        *args: list(*). Positional arguments to pass to the event handler.
+        **kwargs: dict(str: *). Keyword arguments to pass to the event
+            handler.
+
+    Raises:
+        Exception. No event handler corresponds to the given event type.
+    """
+    for handler_class in BaseEventHandler.__subclasses__():
+        if handler_class.EVENT_TYPE == event_type:
+            handler_class.record(*args, **kwargs)
+            return
+    raise Exception('Unknown event type: %s' % event_type)
+
+
 def handle_exploration_start(exp_id):
     """Handles a user's start of an exploration.
 
@@ -206,6 +206,29 @@ class EventHandlerUnitTests(test_utils.GenericTestBase):
             numbers_model.number for numbers_model in MockNumbersModel.query()
         ], [2])
 
+    def test_record_async_handles_the_event_on_the_task_queue(self):
+        TestEventHandler.record_async(3)
+
+        self.assertEqual(MockNumbersModel.query().count(), 0)
+
+        self.process_and_flush_pending_tasks()
+
+        self.assertEqual([
+            numbers_model.number for numbers_model in MockNumbersModel.query()
+        ], [3])
+
+    def test_dispatch_event_routes_to_the_matching_handler(self):
+        event_services.dispatch_event(TestEventHandler.EVENT_TYPE, 4)
+
+        self.assertEqual([
+            numbers_model.number for numbers_model in MockNumbersModel.query()
+        ], [4])
+
+    def test_dispatch_event_with_unknown_event_type_raises_error(self):
+        with self.assertRaisesRegexp(
+            Exception, 'Unknown event type: invalid_event'):
+            event_services.dispatch_event('invalid_event')
+
 
 class StatsEventsHandlerUnitTests(test_utils.GenericTestBase):
     """Tests related to the stats events handler."""
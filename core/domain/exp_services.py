@@ -1326,6 +1326,11 @@ def save_exploration_summary(exp_summary):
         model.update_timestamps()
         model.put()
 
+    caching_services.delete_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_DISPLAYABLE_EXP_SUMMARIES,
+        [exp_summary.id])
+
     # The index should be updated after saving the exploration
     # summary instead of after saving the exploration since the
     # index contains documents computed on basis of exploration
@@ -1346,6 +1351,10 @@ def delete_exploration_summaries(exploration_ids):
         if summary_model is not None
     ]
     exp_models.ExpSummaryModel.delete_multi(existing_summary_models)
+    caching_services.delete_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_DISPLAYABLE_EXP_SUMMARIES,
+        exploration_ids)
 
 
 def revert_exploration(
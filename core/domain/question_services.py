@@ -271,6 +271,32 @@ def get_questions_by_skill_ids(
     return questions
 
 
+def get_question_dicts_by_skill_ids(
+        total_question_count, skill_ids, require_medium_difficulty):
+    """Returns dicts of a constant number of questions linked to each given
+    skill id.
+
+    This is a convenience wrapper around get_questions_by_skill_ids() for
+    callers that only need the dict forms of the questions; the conversion
+    is done in one place instead of each caller looping over the domain
+    objects.
+
+    Args:
+        total_question_count: int. The total number of questions to return.
+        skill_ids: list(str). The IDs of the skills to which the questions
+            should be linked.
+        require_medium_difficulty: bool. Indicates whether the returned
+            questions should be of medium difficulty.
+
+    Returns:
+        list(dict). The dicts of the questions, selected and ordered in the
+        same way as in get_questions_by_skill_ids().
+    """
+    questions = get_questions_by_skill_ids(
+        total_question_count, skill_ids, require_medium_difficulty)
+    return [question.to_dict() for question in questions]
+
+
 def get_new_question_id():
     """Returns a new question id.
 
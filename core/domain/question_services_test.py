@@ -204,6 +204,27 @@ class QuestionServicesUnitTest(test_utils.GenericTestBase):
         self.assertEqual(questions[1].to_dict(), self.question_1.to_dict())
         self.assertEqual(questions[2].to_dict(), self.question_2.to_dict())
 
+    def test_get_question_dicts_by_skill_ids(self):
+        question_services.create_new_question_skill_link(
+            self.editor_id, self.question_id, 'skill_1', 0.3)
+        question_services.create_new_question_skill_link(
+            self.editor_id, self.question_id_1, 'skill_2', 0.8)
+        question_services.create_new_question_skill_link(
+            self.editor_id, self.question_id_2, 'skill_2', 0.5)
+
+        question_dicts = question_services.get_question_dicts_by_skill_ids(
+            4, ['skill_1', 'skill_2'], False)
+
+        expected_question_dicts = {
+            self.question_id: self.question.to_dict(),
+            self.question_id_1: self.question_1.to_dict(),
+            self.question_id_2: self.question_2.to_dict(),
+        }
+        self.assertEqual(len(question_dicts), 3)
+        for question_dict in question_dicts:
+            self.assertEqual(
+                question_dict, expected_question_dicts[question_dict['id']])
+
     def test_get_questions_by_skill_ids_raise_error_with_high_question_count(
             self):
         with self.assertRaisesRegexp(
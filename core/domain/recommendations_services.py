@@ -21,9 +21,11 @@ from __future__ import annotations
 import csv
 import datetime
 import json
+import time
 
 from core import feconf
 from core import python_utils
+from core.domain import caching_services
 from core.domain import rights_domain
 from core.platform import models
 
@@ -96,6 +98,13 @@ RECOMMENDATION_CATEGORIES = [
     'Welcome'
 ]
 
+# Number of seconds after which a cached exploration recommendations list
+# is treated as stale. Writers that go through this module delete cache
+# entries eagerly; the expiry bounds the staleness caused by the
+# recommendations batch job, which writes its models directly from the
+# pipeline and cannot reach the cache.
+EXPLORATION_RECOMMENDATIONS_CACHE_TTL_SECS = 60
+
 
 def get_topic_similarities_dict():
     """Returns a 2d dict of topic similarities. Creates the default similarity
@@ -331,6 +340,76 @@ def get_item_similarity(reference_exp_summary, compared_exp_summary):
     return similarity_score
 
 
+def get_item_similarities(reference_exp_summary, compared_exp_summaries):
+    """Yields the ranking of each compared exploration to reference_exp as a
+    recommendation, using the same scoring as get_item_similarity().
+
+    Looking up a topic similarity loads the topic similarities table from
+    the datastore, so this batch variant loads the table at most once for
+    the whole batch instead of once per compared exploration. The reference
+    exploration's features are also read only once.
+
+    Args:
+        reference_exp_summary: ExpSummaryModel. The reference exploration
+            summary. The similarity scores say how similar the compared
+            summaries are to this summary.
+        compared_exp_summaries: iterable(ExpSummaryModel). The compared
+            exploration summaries.
+
+    Yields:
+        (ExpSummaryModel, float). Tuple of a compared exploration summary
+        and its similarity score, in the order the summaries were given.
+    """
+    reference_category = reference_exp_summary.category
+    reference_category_is_known = (
+        reference_category in RECOMMENDATION_CATEGORIES)
+    reference_owner_ids = reference_exp_summary.owner_ids
+    reference_language_code = reference_exp_summary.language_code
+    # The table is loaded lazily, so batches where no pair of known
+    # categories occurs never pay for the datastore read.
+    topic_similarities = None
+    time_now = datetime.datetime.utcnow()
+
+    for compared_exp_summary in compared_exp_summaries:
+        if (
+                compared_exp_summary.status ==
+                rights_domain.ACTIVITY_STATUS_PRIVATE
+        ):
+            yield compared_exp_summary, 0.0
+            continue
+
+        compared_category = compared_exp_summary.category
+        if (
+                reference_category_is_known and
+                compared_category in RECOMMENDATION_CATEGORIES
+        ):
+            if topic_similarities is None:
+                topic_similarities = get_topic_similarities_dict()
+            topic_similarity_score = (
+                topic_similarities[reference_category][compared_category])
+        elif reference_category == compared_category:
+            topic_similarity_score = feconf.SAME_TOPIC_SIMILARITY
+        else:
+            topic_similarity_score = feconf.DEFAULT_TOPIC_SIMILARITY
+
+        similarity_score = 5.0 * topic_similarity_score
+        if reference_owner_ids == compared_exp_summary.owner_ids:
+            similarity_score += 1.0
+        if (
+                reference_language_code ==
+                compared_exp_summary.language_code
+        ):
+            similarity_score += 2.0
+
+        time_delta_days = int(
+            (time_now -
+             compared_exp_summary.exploration_model_last_updated).days)
+        if time_delta_days <= 7:
+            similarity_score += 1.0
+
+        yield compared_exp_summary, similarity_score
+
+
 def set_exploration_recommendations(exp_id, new_recommendations):
     """Stores a list of exploration ids of recommended explorations to play
     after completing the exploration keyed by exp_id.
@@ -344,12 +423,22 @@ def set_exploration_recommendations(exp_id, new_recommendations):
 
     recommendations_models.ExplorationRecommendationsModel(
         id=exp_id, recommended_exploration_ids=new_recommendations).put()
+    caching_services.delete_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_EXPLORATION_RECOMMENDATIONS,
+        [exp_id])
 
 
 def get_exploration_recommendations(exp_id):
     """Gets a list of ids of at most 10 recommended explorations to play
     after completing the exploration keyed by exp_id.
 
+    The result is cached. Writers that go through this module delete the
+    cache entry immediately, and each entry additionally expires after
+    EXPLORATION_RECOMMENDATIONS_CACHE_TTL_SECS; the expiry bounds the
+    staleness caused by the recommendations batch job, which writes its
+    models directly from the pipeline and cannot reach the cache.
+
     Args:
         exp_id: str. The ID of the exploration for which to get
             the recommendations.
@@ -358,13 +447,29 @@ def get_exploration_recommendations(exp_id):
         list(str). List of recommended explorations IDs.
     """
 
+    cached_entry = caching_services.get_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_EXPLORATION_RECOMMENDATIONS,
+        [exp_id]).get(exp_id)
+    if cached_entry is not None:
+        cached_time, recommended_exploration_ids = cached_entry
+        if (
+                time.time() - cached_time <
+                EXPLORATION_RECOMMENDATIONS_CACHE_TTL_SECS
+        ):
+            return recommended_exploration_ids
+
     recommendations_model = (
         recommendations_models.ExplorationRecommendationsModel.get(
             exp_id, strict=False))
-    if recommendations_model is None:
-        return []
-    else:
-        return recommendations_model.recommended_exploration_ids
+    recommended_exploration_ids = (
+        [] if recommendations_model is None
+        else recommendations_model.recommended_exploration_ids)
+    caching_services.set_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_EXPLORATION_RECOMMENDATIONS,
+        {exp_id: [time.time(), recommended_exploration_ids]})
+    return recommended_exploration_ids
 
 
 def delete_explorations_from_recommendations(exp_ids):
@@ -404,3 +509,7 @@ def delete_explorations_from_recommendations(exp_ids):
     entities = list(all_recommending_models.values())
     recs_model_class.update_timestamps_multi(entities)
     recs_model_class.put_multi(entities)
+    caching_services.delete_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_EXPLORATION_RECOMMENDATIONS,
+        exp_ids + list(all_recommending_models.keys()))
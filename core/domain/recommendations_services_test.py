@@ -18,6 +18,8 @@
 
 from __future__ import annotations
 
+import time
+
 from core import feconf
 from core.domain import exp_services
 from core.domain import recommendations_services
@@ -308,6 +310,87 @@ class RecommendationsServicesUnitTests(test_utils.GenericTestBase):
                 'exp_id_1'))
         self.assertEqual(recommended_exp_ids, saved_recommendation_ids)
 
+    def test_get_exploration_recommendations_is_served_from_the_cache(self):
+        recommendations_services.set_exploration_recommendations(
+            'exp_id_1', ['exp_id_2'])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            ['exp_id_2'])
+
+        # Writing the model directly bypasses the cache invalidation that
+        # set_exploration_recommendations performs, so the previously
+        # cached list keeps being served.
+        recommendations_models.ExplorationRecommendationsModel(
+            id='exp_id_1', recommended_exploration_ids=['exp_id_3']).put()
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            ['exp_id_2'])
+
+    def test_cached_exploration_recommendations_expire(self):
+        recommendations_services.set_exploration_recommendations(
+            'exp_id_1', ['exp_id_2'])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            ['exp_id_2'])
+        recommendations_models.ExplorationRecommendationsModel(
+            id='exp_id_1', recommended_exploration_ids=['exp_id_3']).put()
+
+        # Once the TTL has passed, the cached entry is treated as stale and
+        # the direct model write becomes visible.
+        expired_time = time.time() + (
+            recommendations_services
+            .EXPLORATION_RECOMMENDATIONS_CACHE_TTL_SECS + 1)
+        with self.swap(time, 'time', lambda: expired_time):
+            self.assertEqual(
+                recommendations_services.get_exploration_recommendations(
+                    'exp_id_1'),
+                ['exp_id_3'])
+
+    def test_set_exploration_recommendations_invalidates_the_cache(self):
+        recommendations_services.set_exploration_recommendations(
+            'exp_id_1', ['exp_id_2'])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            ['exp_id_2'])
+
+        recommendations_services.set_exploration_recommendations(
+            'exp_id_1', ['exp_id_3', 'exp_id_4'])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            ['exp_id_3', 'exp_id_4'])
+
+    def test_delete_explorations_from_recommendations_invalidates_cache(self):
+        recommendations_services.set_exploration_recommendations(
+            'exp_id_1', ['exp_id_3', 'exp_id_4'])
+        recommendations_services.set_exploration_recommendations(
+            'exp_id_2', ['exp_id_1', 'exp_id_3'])
+        # Warm the cache for both the deleted exploration and one that
+        # recommends it.
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            ['exp_id_3', 'exp_id_4'])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_2'),
+            ['exp_id_1', 'exp_id_3'])
+
+        recommendations_services.delete_explorations_from_recommendations([
+            'exp_id_3', 'exp_id_4'])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_1'),
+            [])
+        self.assertEqual(
+            recommendations_services.get_exploration_recommendations(
+                'exp_id_2'),
+            ['exp_id_1'])
+
     def test_delete_recommendations_for_exploration(self):
         recommendations_services.delete_explorations_from_recommendations([
             'exp_id_1', 'exp_id_2'])
@@ -18,10 +18,13 @@
 
 from __future__ import annotations
 
+import operator
+
 from core import python_utils
 from core import utils
 from core.constants import constants
 from core.domain import activity_services
+from core.domain import caching_services
 from core.domain import collection_services
 from core.domain import exp_domain
 from core.domain import exp_fetchers
@@ -339,6 +342,53 @@ def get_displayable_exp_summary_dicts_matching_ids(exploration_ids, user=None):
     return get_displayable_exp_summary_dicts(filtered_exploration_summaries)
 
 
+def get_displayable_exp_summary_dicts_matching_ids_cached(exploration_ids):
+    """Gets displayable exploration summary dicts from the cache, computing
+    and caching any that are missing.
+
+    This is a read-through cache around
+    get_displayable_exp_summary_dicts_matching_ids for the no-user case:
+    only publicly visible summaries are returned, so the cached dicts are
+    identical for every caller. Entries are invalidated when the summary is
+    saved or deleted, which means the view counts baked into the dicts may
+    lag slightly behind the live stats. IDs with no displayable summary
+    (deleted or private explorations) are not cached, so they are
+    re-checked on every request.
+
+    Args:
+        exploration_ids: list(str). List of exploration ids.
+
+    Returns:
+        list(dict). A list of exploration summary dicts in human readable
+        form, in the same format as
+        get_displayable_exp_summary_dicts_matching_ids.
+    """
+    exploration_ids = list(exploration_ids)
+    summary_dicts_by_id = caching_services.get_multi(
+        caching_services.CACHE_NAMESPACE_DEFAULT,
+        caching_services.SUB_NAMESPACE_DISPLAYABLE_EXP_SUMMARIES,
+        exploration_ids)
+
+    uncached_exp_ids = [
+        exp_id for exp_id in exploration_ids
+        if exp_id not in summary_dicts_by_id]
+    if uncached_exp_ids:
+        computed_summary_dicts = (
+            get_displayable_exp_summary_dicts_matching_ids(uncached_exp_ids))
+        computed_dicts_by_id = {
+            summary_dict['id']: summary_dict
+            for summary_dict in computed_summary_dicts}
+        caching_services.set_multi(
+            caching_services.CACHE_NAMESPACE_DEFAULT,
+            caching_services.SUB_NAMESPACE_DISPLAYABLE_EXP_SUMMARIES,
+            computed_dicts_by_id)
+        summary_dicts_by_id.update(computed_dicts_by_id)
+
+    return [
+        summary_dicts_by_id[exp_id] for exp_id in exploration_ids
+        if exp_id in summary_dicts_by_id]
+
+
 def get_displayable_exp_summary_dicts(exploration_summaries):
     """Gets a summary of explorations in human readable form.
 
@@ -687,7 +737,7 @@ def get_top_rated_exploration_summary_dicts(language_codes, limit):
 
     sorted_exp_summaries = sorted(
         filtered_exp_summaries,
-        key=lambda exp_summary: exp_summary.scaled_average_rating,
+        key=operator.attrgetter('scaled_average_rating'),
         reverse=True)
 
     return get_displayable_exp_summary_dicts(sorted_exp_summaries)
@@ -725,7 +775,7 @@ def get_recently_published_exp_summary_dicts(limit):
     # sorted() is used to sort the random list of recently published summaries.
     summaries = sorted(
         recently_published_exploration_summaries,
-        key=lambda exp_summary: exp_summary.first_published_msec,
+        key=operator.attrgetter('first_published_msec'),
         reverse=True)
 
     return get_displayable_exp_summary_dicts(summaries)
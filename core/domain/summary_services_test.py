@@ -23,6 +23,7 @@ from core import utils
 from core.constants import constants
 from core.domain import activity_domain
 from core.domain import activity_services
+from core.domain import caching_services
 from core.domain import collection_domain
 from core.domain import collection_services
 from core.domain import exp_domain
@@ -223,6 +224,47 @@ class ExplorationDisplayableSummariesTest(
                 ['invalid_exp_id']))
         self.assertEqual(displayable_summaries, [])
 
+    def test_cached_summary_dicts_are_invalidated_on_summary_writes(self):
+        # Warm the cache with the published exploration's summary dict.
+        displayable_summaries = (
+            summary_services
+            .get_displayable_exp_summary_dicts_matching_ids_cached(
+                [self.EXP_ID_2]))
+        self.assertEqual(
+            displayable_summaries[0]['title'], 'Exploration 2 Albert title')
+        self.assertIn(
+            self.EXP_ID_2,
+            caching_services.get_multi(
+                caching_services.CACHE_NAMESPACE_DEFAULT,
+                caching_services.SUB_NAMESPACE_DISPLAYABLE_EXP_SUMMARIES,
+                [self.EXP_ID_2]))
+
+        # Saving the summary must evict the cached dict, so the next read
+        # reflects the update instead of the warmed entry.
+        exp_services.update_exploration(
+            self.albert_id, self.EXP_ID_2, [exp_domain.ExplorationChange({
+                'cmd': 'edit_exploration_property',
+                'property_name': 'title',
+                'new_value': 'Exploration 2 new title'
+            })], 'Changed title.')
+
+        displayable_summaries = (
+            summary_services
+            .get_displayable_exp_summary_dicts_matching_ids_cached(
+                [self.EXP_ID_2]))
+        self.assertEqual(
+            displayable_summaries[0]['title'], 'Exploration 2 new title')
+
+        # Deleting the summary must evict the re-warmed dict too, so the
+        # exploration stops being returned after deletion.
+        exp_services.delete_exploration(self.albert_id, self.EXP_ID_2)
+
+        self.assertEqual(
+            summary_services
+            .get_displayable_exp_summary_dicts_matching_ids_cached(
+                [self.EXP_ID_2]),
+            [])
+
     def test_get_public_and_filtered_private_summary_dicts_for_creator(self):
         # If a new exploration is created by another user (Bob) and not public,
         # then Albert cannot see it when querying for explorations.
@@ -18,7 +18,11 @@
 
 from __future__ import annotations
 
+import heapq
+import operator
+
 from core.domain import recommendations_services
+from core.domain import rights_domain
 from core.jobs import base_jobs
 from core.jobs.io import ndb_io
 from core.jobs.types import job_run_result
@@ -26,7 +30,7 @@ from core.platform import models
 
 import apache_beam as beam
 
-from typing import Dict, Iterable, List, Tuple, Union, cast
+from typing import Iterable, List, Tuple, cast
 
 MYPY = False
 if MYPY: # pragma: no cover
@@ -43,6 +47,33 @@ MAX_RECOMMENDATIONS = 10
 # Note: There is a threshold so that bad recommendations will be
 # discarded even if an exploration has few similar explorations.
 SIMILARITY_SCORE_THRESHOLD = 3.0
+# Bounded similarity buffers are compacted back down to
+# MAX_RECOMMENDATIONS entries once they grow past this size. Compacting
+# lazily amortizes the heap selection over several additions.
+MAX_PENDING_SIMILARITIES = 2 * MAX_RECOMMENDATIONS
+
+
+def _keep_top_similarities(
+    similarities: List[Tuple[float, str]]
+) -> List[Tuple[float, str]]:
+    """Truncates similarities to the top MAX_RECOMMENDATIONS entries.
+
+    The selection key is the score alone, never the whole tuple:
+    heapq.nlargest is stable with a key, so equal scores keep their
+    arrival order instead of falling back to exploration ID comparison.
+
+    Args:
+        similarities: list((float, str)). The similarities, as (similarity
+            score, exploration ID) pairs, to truncate.
+
+    Returns:
+        list((float, str)). The top similarities, sorted by descending
+        similarity score.
+    """
+    return heapq.nlargest(
+        MAX_RECOMMENDATIONS,
+        similarities,
+        key=operator.itemgetter(0))
 
 
 class ComputeExplorationRecommendationsJob(base_jobs.JobBase):
@@ -63,20 +94,40 @@ class ComputeExplorationRecommendationsJob(base_jobs.JobBase):
                 ndb_io.GetModels(exp_models.ExpSummaryModel.get_all()))
         )
 
-        exp_summary_iter = beam.pvalue.AsIter(exp_summary_models)
+        # Private explorations always score 0.0 against every reference
+        # (see recommendations_services.get_item_similarity), which is below
+        # SIMILARITY_SCORE_THRESHOLD, so dropping them from the compared
+        # side up front skips a full scan's worth of scoring per reference.
+        public_exp_summary_models = (
+            exp_summary_models
+            | 'Filter out private summaries' >> beam.Filter(
+                lambda model: (
+                    model.status != rights_domain.ACTIVITY_STATUS_PRIVATE))
+        )
+
+        # AsList materializes the side input once per worker; AsIter would
+        # re-stream every summary for each element processed by the ParDo.
+        exp_summary_list = beam.pvalue.AsList(public_exp_summary_models)
 
         exp_recommendations_models = (
             exp_summary_models
+            # Without the reshuffle the runner is free to fuse the similarity
+            # ParDo with the datastore read, which would serialize the
+            # quadratic comparison onto however few bundles the read
+            # produced. The fusion break lets the work spread over all
+            # workers.
+            | 'Reshuffle for parallelism' >> beam.Reshuffle()
             | 'Compute similarity' >> beam.ParDo(
-                ComputeSimilarity(), exp_summary_iter)
-            | 'Group similarities per exploration ID' >> beam.GroupByKey()
-            | 'Sort and slice similarities' >> beam.MapTuple(
-                lambda exp_id, similarities: (
-                    exp_id, self._sort_and_slice_similarities(similarities)))
-            | 'Create recommendation models' >> beam.MapTuple(
-                self._create_recommendation)
+                ComputeSimilarity(), exp_summary_list)
+            | 'Keep top similarities per exploration ID' >> (
+                beam.CombinePerKey(TopKSimilaritiesCombineFn()))
+            | 'Create recommendation models' >> beam.ParDo(
+                CreateRecommendation())
         )
 
+        # PutModels writes through datastoreio.WriteToDatastore, which
+        # already groups mutations into batched RPCs, so no extra batching
+        # step is needed here.
         unused_put_result = (
             exp_recommendations_models
             | 'Put models into the datastore' >> ndb_io.PutModels()
@@ -92,60 +143,127 @@ class ComputeExplorationRecommendationsJob(base_jobs.JobBase):
                     stdout='SUCCESS %s' % x))
         )
 
-    @staticmethod
-    def _sort_and_slice_similarities(
-            similarities: Iterable[Dict[str, Union[str, float]]]
-    ) -> List[str]:
-        """Sorts similarities of explorations and slices them to
-        a maximum length.
 
-        Args:
-            similarities:iterable(). Iterable of dictionaries. The structure of
-                the dictionaries is:
-                    exp_id: str. The ID of the similar exploration.
-                    similarity_score: float. The similarity score for
-                        the exploration.
+class NdbContextDoFn(beam.DoFn):  # type: ignore[misc]
+    """DoFn that holds an NDB context open for the lifetime of the worker.
+
+    Entering the context once in setup() saves re-entering it (and
+    re-initializing its thread-local state) for every element processed.
+    """
+
+    def setup(self) -> None:
+        """Enters an NDB context for this worker."""
+        self._ndb_context = datastore_services.get_ndb_context()
+        self._ndb_context.__enter__()
+
+    def teardown(self) -> None:
+        """Exits the NDB context entered in setup()."""
+        self._ndb_context.__exit__(None, None, None)
 
-        Returns:
-            list(str). List of exploration IDs, sorted by the similarity.
-        """
-        sorted_similarities = sorted(
-            similarities, reverse=True, key=lambda x: x['similarity_score'])
-        return [
-                str(item['exp_id']) for item in sorted_similarities
-            ][:MAX_RECOMMENDATIONS]
 
-    @staticmethod
-    def _create_recommendation(
-            exp_id: str, recommended_exp_ids: Iterable[str]
-    ) -> recommendations_models.ExplorationRecommendationsModel:
+class CreateRecommendation(NdbContextDoFn):
+    """DoFn to create exploration recommendation models."""
+
+    def process(
+        self, element: Tuple[str, List[str]]
+    ) -> Iterable[recommendations_models.ExplorationRecommendationsModel]:
         """Creates exploration recommendation model.
 
         Args:
-            exp_id: str. The exploration ID for which the recommendation is
-                created.
-            recommended_exp_ids: list(str). The list of recommended
+            element: (str, list(str)). Tuple of the exploration ID for which
+                the recommendation is created and the list of recommended
                 exploration IDs.
 
-        Returns:
+        Yields:
             ExplorationRecommendationsModel. The created model.
         """
-        with datastore_services.get_ndb_context():
-            exp_recommendation_model = (
-                recommendations_models.ExplorationRecommendationsModel(
-                    id=exp_id, recommended_exploration_ids=recommended_exp_ids))
+        exp_id, recommended_exp_ids = element
+        exp_recommendation_model = (
+            recommendations_models.ExplorationRecommendationsModel(
+                id=exp_id, recommended_exploration_ids=recommended_exp_ids))
         exp_recommendation_model.update_timestamps()
-        return exp_recommendation_model
+        yield exp_recommendation_model
+
+
+class TopKSimilaritiesCombineFn(beam.CombineFn):  # type: ignore[misc]
+    """CombineFn that keeps only the top MAX_RECOMMENDATIONS similarities.
 
+    Running this as a per-key combiner lets Beam truncate the candidate
+    lists on each worker before the shuffle, so at most MAX_RECOMMENDATIONS
+    similarities per key are shuffled instead of every above-threshold pair.
+    """
 
-class ComputeSimilarity(beam.DoFn):  # type: ignore[misc]
+    def create_accumulator(self) -> List[Tuple[float, str]]:
+        """Creates an empty accumulator of similarities.
+
+        Returns:
+            list((float, str)). The empty accumulator.
+        """
+        return []
+
+    def add_input(
+        self,
+        accumulator: List[Tuple[float, str]],
+        similarity: Tuple[float, str]
+    ) -> List[Tuple[float, str]]:
+        """Adds one similarity to the accumulator.
+
+        Args:
+            accumulator: list((float, str)). The accumulated similarities,
+                as (similarity score, exploration ID) pairs.
+            similarity: (float, str). The similarity to add.
+
+        Returns:
+            list((float, str)). The updated accumulator.
+        """
+        accumulator.append(similarity)
+        if len(accumulator) > MAX_PENDING_SIMILARITIES:
+            return _keep_top_similarities(accumulator)
+        return accumulator
+
+    def merge_accumulators(
+        self,
+        accumulators: Iterable[List[Tuple[float, str]]]
+    ) -> List[Tuple[float, str]]:
+        """Merges several accumulators into one.
+
+        Args:
+            accumulators: iterable(list((float, str))). The accumulators to
+                merge.
+
+        Returns:
+            list((float, str)). The merged accumulator.
+        """
+        return _keep_top_similarities([
+            similarity
+            for accumulator in accumulators
+            for similarity in accumulator
+        ])
+
+    def extract_output(
+        self, accumulator: List[Tuple[float, str]]
+    ) -> List[str]:
+        """Extracts the top recommended exploration IDs from the accumulator.
+
+        Args:
+            accumulator: list((float, str)). The accumulated similarities.
+
+        Returns:
+            list(str). List of exploration IDs, sorted by the similarity.
+        """
+        return [
+            exp_id for _, exp_id in _keep_top_similarities(accumulator)
+        ]
+
+
+class ComputeSimilarity(NdbContextDoFn):
     """DoFn to compute similarities between exploration."""
 
     def process(
         self,
         ref_exp_summary_model: datastore_services.Model,
-        compared_exp_summary_models: Iterable[datastore_services.Model]
-    ) -> Iterable[Tuple[str, Dict[str, Union[str, float]]]]:
+        compared_exp_summary_models: List[datastore_services.Model]
+    ) -> Iterable[Tuple[str, Tuple[float, str]]]:
         """Compute similarities between exploraitons.
 
         Args:
@@ -157,30 +275,35 @@ class ComputeSimilarity(beam.DoFn):  # type: ignore[misc]
                 summary.
 
         Yields:
-            (str, dict(str, str|float)). Tuple, the first element is
-            the exploration ID of the reference exploration summary.
-            The second is a dictionary. The structure of the dictionary is:
-                exp_id: str. The ID of the similar exploration.
-                similarity_score: float. The similarity score for
-                    the exploration.
+            (str, (float, str)). Tuple, the first element is the exploration
+            ID of the reference exploration summary. The second is a pair of
+            the similarity score and the ID of the similar exploration;
+            plain tuples are much cheaper than dicts to allocate and to
+            encode through the shuffle. At most MAX_RECOMMENDATIONS pairs
+            are yielded per reference exploration, since anything beyond
+            that could never survive the downstream top-K combine.
         """
+        # The casts are hoisted out of the loop: cast() is free for mypy but
+        # is still a real function call at runtime, which adds up over the
+        # quadratic number of comparisons.
         ref_exp_summary_model = cast(
             exp_models.ExpSummaryModel, ref_exp_summary_model)
-        with datastore_services.get_ndb_context():
-            for compared_exp_summary_model in compared_exp_summary_models:
-                compared_exp_summary_model = cast(
-                    exp_models.ExpSummaryModel,
-                    compared_exp_summary_model
-                )
-                if compared_exp_summary_model.id == ref_exp_summary_model.id:
-                    continue
-                similarity_score = recommendations_services.get_item_similarity( # type: ignore[no-untyped-call]
-                    ref_exp_summary_model, compared_exp_summary_model
-                )
-                if similarity_score >= SIMILARITY_SCORE_THRESHOLD:
-                    yield (
-                        ref_exp_summary_model.id, {
-                            'similarity_score': similarity_score,
-                            'exp_id': compared_exp_summary_model.id
-                        }
-                    )
+        top_similarities: List[Tuple[float, str]] = []
+        # The batch variant of get_item_similarity loads the topic
+        # similarities table at most once per batch, instead of once per
+        # compared exploration.
+        for compared_exp_summary_model, similarity_score in (
+                recommendations_services.get_item_similarities( # type: ignore[no-untyped-call]
+                    ref_exp_summary_model, compared_exp_summary_models)):
+            if compared_exp_summary_model.id == ref_exp_summary_model.id:
+                continue
+            if similarity_score >= SIMILARITY_SCORE_THRESHOLD:
+                top_similarities.append(
+                    (similarity_score, compared_exp_summary_model.id))
+                if len(top_similarities) > MAX_PENDING_SIMILARITIES:
+                    top_similarities = _keep_top_similarities(
+                        top_similarities)
+
+        ref_exp_id = ref_exp_summary_model.id
+        for similarity in _keep_top_similarities(top_similarities):
+            yield (ref_exp_id, similarity)
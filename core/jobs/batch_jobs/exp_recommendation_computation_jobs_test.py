@@ -26,6 +26,7 @@ from core.jobs import job_test_utils
 from core.jobs.batch_jobs import exp_recommendation_computation_jobs
 from core.jobs.types import job_run_result
 from core.platform import models
+from core.tests import test_utils
 
 from typing import Dict, List, Tuple, Union # isort:skip
 
@@ -213,6 +214,54 @@ class ComputeExplorationRecommendationsJobTests(job_test_utils.JobTestBase):
                 self.EXP_2_ID, strict=False))
         self.assertIsNone(exp_recommendations_model_2)
 
+    def test_caps_recommendations_for_many_similar_explorations(self) -> None:
+        # One more candidate per reference than MAX_PENDING_SIMILARITIES, so
+        # that the similarity buffer is compacted mid-scan before the final
+        # truncation.
+        exp_count = (
+            exp_recommendation_computation_jobs.MAX_PENDING_SIMILARITIES + 2)
+        exp_ids = ['exp_%s_id' % i for i in range(exp_count)]
+
+        recommendations_services.create_default_topic_similarities()  # type: ignore[no-untyped-call]
+        exp_summaries = []
+        for exp_id in exp_ids:
+            exp_summary = self.create_model(
+                exp_models.ExpSummaryModel,
+                id=exp_id,
+                deleted=False,
+                title='title',
+                category='Architecture',
+                objective='objective',
+                language_code='lang',
+                community_owned=False,
+                status=constants.ACTIVITY_STATUS_PUBLIC,
+                exploration_model_last_updated=datetime.datetime.utcnow()
+            )
+            exp_summary.update_timestamps()
+            exp_summaries.append(exp_summary)
+        self.put_multi(exp_summaries)
+
+        self.assert_job_output_is([
+            job_run_result.JobRunResult(stdout='SUCCESS %s' % exp_count)
+        ])
+
+        # All candidates score the same, so the exact selection is not
+        # guaranteed, but every exploration must end up with exactly
+        # MAX_RECOMMENDATIONS recommendations drawn from the others.
+        for exp_id in exp_ids:
+            exp_recommendations_model = (
+                recommendations_models.ExplorationRecommendationsModel.get(
+                    exp_id))
+            # Ruling out the possibility of None for mypy type checking.
+            assert exp_recommendations_model is not None
+            recommended_exp_ids = (
+                exp_recommendations_model.recommended_exploration_ids)
+            self.assertEqual(
+                len(recommended_exp_ids),
+                exp_recommendation_computation_jobs.MAX_RECOMMENDATIONS)
+            self.assertNotIn(exp_id, recommended_exp_ids)
+            self.assertLessEqual(set(recommended_exp_ids), set(exp_ids))
+
     def test_creates_recommendations_for_three_explorations(self) -> None:
         recommendations_services.create_default_topic_similarities()  # type: ignore[no-untyped-call]
         exp_summary_1 = self.create_model(
@@ -287,3 +336,67 @@ class ComputeExplorationRecommendationsJobTests(job_test_utils.JobTestBase):
             exp_recommendations_model_3.recommended_exploration_ids,
             [self.EXP_1_ID, self.EXP_2_ID]
         )
+
+
+class TopKSimilaritiesCombineFnTests(test_utils.TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.combine_fn = (
+            exp_recommendation_computation_jobs.TopKSimilaritiesCombineFn())
+
+    def test_add_input_appends_below_the_compaction_threshold(self) -> None:
+        accumulator = self.combine_fn.create_accumulator()
+        for i in range(
+                exp_recommendation_computation_jobs.MAX_PENDING_SIMILARITIES):
+            accumulator = self.combine_fn.add_input(
+                accumulator, (float(i), 'exp_%s_id' % i))
+
+        self.assertEqual(
+            len(accumulator),
+            exp_recommendation_computation_jobs.MAX_PENDING_SIMILARITIES)
+
+    def test_add_input_compacts_once_buffer_exceeds_threshold(self) -> None:
+        accumulator = self.combine_fn.create_accumulator()
+        for i in range(
+                exp_recommendation_computation_jobs.MAX_PENDING_SIMILARITIES
+                + 1):
+            accumulator = self.combine_fn.add_input(
+                accumulator, (float(i), 'exp_%s_id' % i))
+
+        self.assertEqual(
+            accumulator,
+            [
+                (float(i), 'exp_%s_id' % i) for i in range(
+                    exp_recommendation_computation_jobs
+                    .MAX_PENDING_SIMILARITIES,
+                    exp_recommendation_computation_jobs
+                    .MAX_PENDING_SIMILARITIES
+                    - exp_recommendation_computation_jobs.MAX_RECOMMENDATIONS,
+                    -1)
+            ])
+
+    def test_merge_accumulators_keeps_top_similarities(self) -> None:
+        merged = self.combine_fn.merge_accumulators([
+            [(4.0, 'exp_1_id'), (8.0, 'exp_2_id')],
+            [(6.0, 'exp_3_id')],
+            [(float(i), 'exp_%s_id' % (i + 10)) for i in range(10, 20)],
+        ])
+
+        self.assertEqual(
+            len(merged),
+            exp_recommendation_computation_jobs.MAX_RECOMMENDATIONS)
+        self.assertEqual(merged[0], (19.0, 'exp_29_id'))
+        self.assertNotIn((4.0, 'exp_1_id'), merged)
+
+    def test_extract_output_orders_ids_by_descending_score(self) -> None:
+        self.assertEqual(
+            self.combine_fn.extract_output(
+                [(4.0, 'exp_1_id'), (8.0, 'exp_2_id'), (6.0, 'exp_3_id')]),
+            ['exp_2_id', 'exp_3_id', 'exp_1_id'])
+
+    def test_equal_scores_keep_their_arrival_order(self) -> None:
+        self.assertEqual(
+            self.combine_fn.extract_output(
+                [(5.0, 'exp_2_id'), (5.0, 'exp_1_id'), (5.0, 'exp_3_id')]),
+            ['exp_2_id', 'exp_1_id', 'exp_3_id'])
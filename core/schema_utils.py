@@ -26,6 +26,7 @@ following Python types: bool, dict, float, int, list, unicode.
 
 from __future__ import annotations
 
+import functools
 import numbers
 import re
 import urllib
@@ -38,7 +39,7 @@ from core.domain import expression_parser
 from core.domain import html_cleaner
 from core.domain import user_domain
 
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Pattern, cast
 
 SCHEMA_KEY_ITEMS = 'items'
 SCHEMA_KEY_LEN = 'len'
@@ -72,6 +73,23 @@ SCHEMA_OBJ_TYPE_SUBTITLED_UNICODE = 'SubtitledUnicode'
 EMAIL_REGEX = r'[\w\.\+\-]+\@[\w]+\.[a-z]{2,3}'
 
 
+@functools.lru_cache(maxsize=None)
+def _get_compiled_regex(regex_pattern: str) -> Pattern[str]:
+    """Returns a compiled regex for the given pattern.
+
+    The compiled regex is cached, since validators like 'is_regex_matched'
+    apply the same small set of patterns on every schema validation and
+    should not re-parse them each time.
+
+    Args:
+        regex_pattern: str. The regex pattern to compile.
+
+    Returns:
+        Pattern. The compiled regex corresponding to the given pattern.
+    """
+    return re.compile(regex_pattern)
+
+
 # Using Dict[str, Any] here for schema because the following schema can have a
 # recursive structure and mypy doesn't support recursive type currently.
 # See: https://github.com/python/mypy/issues/731
@@ -219,11 +237,13 @@ def normalize_against_schema(
             validate_class = schema[SCHEMA_KEY_OBJECT_CLASS]
             domain_object = validate_class.from_dict(obj)
             domain_object.validate()
+            # The domain object is returned as the normalized value, so that
+            # handlers do not need to re-parse the dict they were given.
+            normalized_obj = domain_object
         else:
             validation_method = schema[SCHEMA_KEY_VALIDATION_METHOD]
             validation_method(obj)
-
-        normalized_obj = obj
+            normalized_obj = obj
     else:
         raise Exception('Invalid schema type: %s' % schema[SCHEMA_KEY_TYPE])
 
@@ -264,9 +284,13 @@ def normalize_against_schema(
     return normalized_obj
 
 
+@functools.lru_cache(maxsize=None)
 def get_validator(validator_id: str) -> Callable[..., bool]:
     """Get the validator method corresponding to the given validator_id.
 
+    The resolved method is cached, since validators are looked up repeatedly
+    with the same ids on every schema validation.
+
     Args:
         validator_id: str. The name of the validator method that should
             be retrieved.
@@ -649,7 +673,7 @@ class _Validators:
         Returns:
             bool. Whether the given object matched with the regex pattern.
         """
-        return bool(re.match(regex_pattern, obj))
+        return bool(_get_compiled_regex(regex_pattern).match(obj))
 
     @staticmethod
     def is_search_query_string(obj: str) -> bool:
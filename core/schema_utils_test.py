@@ -1206,22 +1206,17 @@ class SchemaNormalizationUnitTests(test_utils.GenericTestBase):
             'object_class': ValidateClassForTesting
         }
 
-        mappings = [
-            ({
-                'arg_a': 'arbitary_argument_a',
-                'arg_b': 'arbitary_argument_b'
-            }, {
-                'arg_a': 'arbitary_argument_a',
-                'arg_b': 'arbitary_argument_b'
-            })
-        ]
-
-        # Type Any used because its passed as an argument to check_normalization
-        # method defined above.
-        invalid_values_with_error_messages: List[Tuple[Any, str]] = []
+        obj = {
+            'arg_a': 'arbitary_argument_a',
+            'arg_b': 'arbitary_argument_b'
+        }
 
-        self.check_normalization(
-            schema, mappings, invalid_values_with_error_messages)
+        # Schemas with an 'object_class' key normalize the given dict to the
+        # corresponding domain object.
+        normalized_obj = schema_utils.normalize_against_schema(obj, schema)
+        self.assertIsInstance(normalized_obj, ValidateClassForTesting)
+        self.assertEqual(normalized_obj.arg_a, 'arbitary_argument_a')
+        self.assertEqual(normalized_obj.arg_b, 'arbitary_argument_b')
 
     def test_notification_user_ids_list_validator(self) -> None:
         schema = email_manager.NOTIFICATION_USER_IDS_LIST_SCHEMA
@@ -28,6 +28,7 @@ import random
 import re
 import string
 import sys
+import threading
 import time
 import unicodedata
 import urllib
@@ -589,6 +590,48 @@ def are_datetimes_close(
     return difference_in_secs < feconf.PROXIMAL_TIMEDELTA_SECS
 
 
+# Number of random bytes fetched from the OS in one go by
+# _get_random_bytes(). Every os.urandom() call is a system call, so entropy
+# is fetched in blocks and handed out from an in-process pool.
+_RANDOM_BYTES_POOL_SIZE = 4096
+
+_random_bytes_pool = b''
+_random_bytes_pool_offset = 0
+# The pid that filled the pool. If the process forks, the child must refill
+# its pool rather than hand out the same bytes as the parent.
+_random_bytes_pool_pid: Optional[int] = None
+_random_bytes_pool_lock = threading.Lock()
+
+
+def _get_random_bytes(length: int) -> bytes:
+    """Returns the given number of random bytes from a pooled buffer.
+
+    The bytes come from os.urandom(), fetched one block at a time; each call
+    consumes a fresh slice of the pool, so bytes are never handed out twice.
+
+    Args:
+        length: int. Number of random bytes to return. Must be at most the
+            pool size.
+
+    Returns:
+        bytes. The requested number of random bytes.
+    """
+    global _random_bytes_pool
+    global _random_bytes_pool_offset
+    global _random_bytes_pool_pid
+    with _random_bytes_pool_lock:
+        if (
+                _random_bytes_pool_pid != os.getpid() or
+                _random_bytes_pool_offset + length > len(_random_bytes_pool)
+        ):
+            _random_bytes_pool = os.urandom(_RANDOM_BYTES_POOL_SIZE)
+            _random_bytes_pool_offset = 0
+            _random_bytes_pool_pid = os.getpid()
+        start = _random_bytes_pool_offset
+        _random_bytes_pool_offset += length
+        return _random_bytes_pool[start:_random_bytes_pool_offset]
+
+
 def generate_random_string(length: int) -> str:
     """Generates a random string of the specified length.
 
@@ -598,7 +641,8 @@ def generate_random_string(length: int) -> str:
     Returns:
         str. Random string of specified length.
     """
-    return base64.urlsafe_b64encode(os.urandom(length))[:length].decode('utf-8')
+    return base64.urlsafe_b64encode(
+        _get_random_bytes(length))[:length].decode('utf-8')
 
 
 def generate_new_session_id() -> str: